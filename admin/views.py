@@ -48,51 +48,143 @@ Custom Template Filters:
     - 'format_label': Formats a label by replacing underscores with spaces.
 """
 
-import ast
-import copy
 import csv
+import functools
+import hashlib
 import io
+import itertools
+import operator
 import string
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from types import MappingProxyType, SimpleNamespace
 
+import admin_view
 import boto3
 import inflect
-import pandas as pd
 from admin_view import *  # noqa: F401, F403
-from admin_view import admin_configs
+from admin_view import FlaskAdmin, admin_configs
 from bolbhavPlus.utils.sale_receipt_controller import update_approval_status
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotocoreConfig
 
 # [TODO]: dependency on main repo
 from db import db
-from flask import Response
+from flask import Response, abort
 from flask import current_app as app
 from flask import flash, redirect
 from flask import render_template as real_render_template
-from flask import request, url_for
+from flask import request, stream_with_context, url_for
 from flask_bcrypt import Bcrypt
 from flask_login import current_user, login_required, login_user, logout_user
 from flask_wtf import FlaskForm
+from jinja2 import FileSystemBytecodeCache
 
 # TODO: remove project dependency
 from models.crop import CropModel
 from models.mandi import MandiModel
 from models.salesReceipt import ReceiptRejectionReason, SaleReceiptModel
 from models.user import UserModel
-from sqlalchemy import Text, and_, cast, func, or_
-from sqlalchemy.orm import joinedload
+from sqlalchemy import String, Text, and_, cast, func, inspect, or_
+from sqlalchemy.orm import joinedload, load_only, raiseload, selectinload
 from werkzeug.utils import secure_filename
 from wtforms import PasswordField, StringField, SubmitField
-from wtforms.validators import DataRequired
+from wtforms.validators import DataRequired, Length
 
 from . import admin
 
 bcrypt = Bcrypt()
 
 
+@admin.record_once
+def _init_extensions(state):
+    # runs once when the blueprint is registered, so request handlers do
+    # not have to re-initialize the extension per call
+    bcrypt.init_app(state.app)
+
+    # optional: persist compiled Jinja templates across worker restarts
+    # so cold workers skip the template source -> bytecode compile
+    cache_dir = state.app.config.get("ADMIN_TEMPLATE_CACHE_DIR")
+    if cache_dir:
+        state.app.jinja_env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
+
+
+# inflect engine construction loads sizable word lists, so build it once
+# and share it across filter invocations.
+_INFLECT = inflect.engine()
+
+
 def get_user_model_config():
     return admin_configs["user"]
 
 
+# boto3 client construction parses the S3 service model on every call,
+# so build one lazily and share it; the client is thread-safe. Multipart
+# settings let large files upload their parts concurrently.
+_S3_CLIENT = None
+_S3_CLIENT_LOCK = threading.Lock()
+_S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True,
+)
+
+
+def _get_s3_client():
+    global _S3_CLIENT
+    if _S3_CLIENT is None:
+        with _S3_CLIENT_LOCK:
+            if _S3_CLIENT is None:
+                _S3_CLIENT = boto3.client(
+                    "s3",
+                    aws_access_key_id=app.config["S3_KEY"],
+                    aws_secret_access_key=app.config["S3_SECRET"],
+                    # enough pooled connections for the multipart
+                    # transfer threads plus concurrent uploads
+                    config=BotocoreConfig(max_pool_connections=50),
+                )
+    return _S3_CLIENT
+
+
+# S3 uploads are pure outbound I/O; running them on this pool keeps WSGI
+# workers free to serve other requests while a transfer is in flight.
+_S3_UPLOAD_POOL = ThreadPoolExecutor(max_workers=4)
+
+
+class _BufferedUpload(io.BytesIO):
+    """In-memory copy of an uploaded file that outlives the request."""
+
+    def __init__(self, data, filename, content_type):
+        super().__init__(data)
+        self.filename = filename
+        self.content_type = content_type
+
+
+def upload_file_to_s3_async(file, bucket_name="", acl="public-read"):
+    """
+    Queue an S3 upload on the background pool and return the future.
+
+    The uploaded file is buffered into memory first because the WSGI
+    file object is closed as soon as the response is returned.
+    """
+    if not app.config["S3_KEY"]:
+        return None
+
+    file.stream.seek(0)
+    buffered_file = _BufferedUpload(
+        file.read(), file.filename, file.content_type
+    )
+    real_app = app._get_current_object()
+
+    def _upload():
+        with real_app.app_context():
+            return upload_file_to_s3(buffered_file, bucket_name, acl)
+
+    return _S3_UPLOAD_POOL.submit(_upload)
+
+
 def upload_file_to_s3(file, bucket_name="", acl="public-read"):
     """
     Docs: http://boto3.readthedocs.io/en/latest/guide/s3.html
@@ -103,17 +195,14 @@ def upload_file_to_s3(file, bucket_name="", acl="public-read"):
     if not bucket_name:
         bucket_name = app.config["S3_BUCKET"]
 
-    s3_client = boto3.client(
-        "s3",
-        aws_access_key_id=app.config["S3_KEY"],
-        aws_secret_access_key=app.config["S3_SECRET"],
-    )
+    s3_client = _get_s3_client()
     try:
         s3_client.upload_fileobj(
             file,
             bucket_name,
             file.filename,
             ExtraArgs={"ACL": acl, "ContentType": file.content_type},
+            Config=_S3_TRANSFER_CONFIG,
         )
         return "{}{}".format(app.config["S3_LOCATION"], file.filename)
     except Exception as e:
@@ -121,6 +210,14 @@ def upload_file_to_s3(file, bucket_name="", acl="public-read"):
         return e
 
 
+@functools.lru_cache(maxsize=256)
+def _plural(label):
+    formatted_label = label.replace("-", " ")
+    formatted_label = _INFLECT.plural_noun(formatted_label)
+    formatted_label = string.capwords(formatted_label)
+    return formatted_label
+
+
 @admin.app_template_filter("admin_label_plural")
 def admin_label_plural(label):
     """
@@ -133,11 +230,7 @@ def admin_label_plural(label):
         str: The plural form of the input label.
     """
 
-    p = inflect.engine()
-    formatted_label = label.replace("-", " ")
-    formatted_label = p.plural_noun(formatted_label)
-    formatted_label = string.capwords(formatted_label)
-    return formatted_label
+    return _plural(label)
 
 
 @admin.app_template_filter("admin_label_singular")
@@ -213,65 +306,226 @@ def format_label(value):
     return value.replace("_", " ")
 
 
+@functools.lru_cache(maxsize=512)
+def _nested_getter(key_string):
+    # attrgetter handles dotted paths natively and runs at C level; the
+    # set of key strings is the fixed list_display vocabulary
+    return operator.attrgetter(key_string)
+
+
 @admin.app_template_filter("get_nested_value")
 def get_nested_value(resource, key_string):
-    keys = key_string.split(".")
-    current = resource
-
     try:
-        for key in keys:
-            current = getattr(current, key)
-        return current
-    except (KeyError, TypeError):
+        return _nested_getter(key_string)(resource)
+    except AttributeError:
         return None
 
 
 def get_resource_class(resource_type):
-    class_names = get_class_names("admin_view.py")
-    class_names.remove("FlaskAdmin")
-    for x in class_names:
-        if globals()[x].name == resource_type:
-            return globals()[x]
-    return None
+    return _RESOURCE_CLASSES.get(resource_type)
 
 
-def get_class_names(file_path):
-    """
-    Retrieve a list of class names from a Python file.
+# Resource classes are the FlaskAdmin subclasses declared in admin_view,
+# which is static for the lifetime of the process; collect them once from
+# the already-imported module instead of parsing its source.
+_RESOURCE_CLASSES = {
+    obj.name: obj  # type: ignore[attr-defined]
+    for obj in vars(admin_view).values()
+    if isinstance(obj, type)
+    and issubclass(obj, FlaskAdmin)
+    and obj is not FlaskAdmin
+}
+_RESOURCE_TYPES = tuple(_RESOURCE_CLASSES)
 
-    This function parses the given Python file using the
-    abstract syntax tree (AST) to extract the names of all
-    class definitions present in the file.
 
-    Args:
-        file_path (str): The path to the Python file to be parsed.
+@admin.app_context_processor
+def _inject_resource_types():
+    """
+    Expose the frozen resource-type tuple to every template.
 
-    Returns:
-        list: A list of class names present in the file.
+    Flask merges context-processor values into the render context
+    directly, so the navigation gets its resource list without any
+    per-request allocation or wrapper plumbing.
     """
+    return {"resource_types": _RESOURCE_TYPES}
+
+
+# Default permissions applied when a resource class does not declare its
+# own. Read-only so the shared dict can be handed out without copying.
+_DEFAULT_PERMISSIONS = MappingProxyType(
+    {
+        "create": False,
+        "read": True,
+        "update": False,
+        "delete": False,
+        "export": False,
+        "import": False,
+    }
+)
 
-    with open(file_path, "r", encoding="utf-8") as file:
-        file_content = file.read()
 
-    class_names = []
+def _coerce_value(value):
+    return value if value else None
 
-    # Parse the Python code into an abstract syntax tree (AST)
-    tree = ast.parse(file_content)
 
-    # Traverse the AST and extract class names
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ClassDef):
-            class_names.append(node.name)
+def _coerce_bool(value):
+    if isinstance(value, bool):
+        return bool(value)
+    attribute_value = None
+    if value.lower() == "true":
+        attribute_value = True
+    elif value.lower() == "false":
+        attribute_value = False
+    return attribute_value
 
-    return class_names
+
+def _coerce_unknown(value):
+    return None
+
+
+def _coercer_for(type_name):
+    if "VARCHAR" in type_name or type_name == "TEXT" or type_name == "JSON":
+        return _coerce_value
+    if "INT" in type_name or type_name == "FLOAT":
+        return _coerce_value
+    if type_name == "DATE" or type_name == "DATETIME":
+        return _coerce_value
+    if type_name == "BOOLEAN":
+        return _coerce_bool
+    return _coerce_unknown
+
+
+def _build_readable_attributes(resource_class):
+    model = resource_class.model
+
+    ignore_columns = frozenset(model.__table__.primary_key.columns.keys())
+
+    readable_attributes = []
+    for column in model.__table__.columns:
+        if str(column.name) not in ignore_columns:
+            readable_attributes.append(
+                {"name": str(column.name), "type": str(column.type)}
+            )
+
+    return readable_attributes
+
+
+def _build_editable_attributes(resource_class):
+    model = resource_class.model
+
+    primary_key_columns = model.__table__.primary_key.columns.keys()
+    ignore_columns = frozenset(
+        ["created_at", "updated_at"]
+        + list(primary_key_columns)
+        + list(getattr(resource_class, "protected_attributes", []))
+    )
+
+    editable_attributes = []
+    for column in model.__table__.columns:
+        if str(column.name) not in ignore_columns:
+            column_type = str(column.type)
+            editable_attributes.append(
+                {
+                    "name": str(column.name),
+                    "type": column_type,
+                    "coerce": _coercer_for(column_type),
+                }
+            )
+
+    return editable_attributes
+
+
+# Model metadata never changes at runtime, so derive the per-resource
+# primary key and attribute lists once at import time.
+_RESOURCE_PKS = {
+    resource_type: getattr(resource_class, "pk", "id")
+    for resource_type, resource_class in _RESOURCE_CLASSES.items()
+}
+_READABLE_ATTRS = {
+    resource_type: _build_readable_attributes(resource_class)
+    for resource_type, resource_class in _RESOURCE_CLASSES.items()
+}
+_EDITABLE_ATTRS = {
+    resource_type: _build_editable_attributes(resource_class)
+    for resource_type, resource_class in _RESOURCE_CLASSES.items()
+}
+_PRIMARY_KEY_COLUMNS = {
+    resource_type: resource_class.model.__table__.primary_key.columns.keys()[  # type: ignore[attr-defined] # noqa: B950
+        0
+    ]
+    for resource_type, resource_class in _RESOURCE_CLASSES.items()
+}
+_DOWNLOADABLE_ATTRS = {
+    resource_type: tuple(resource_class.model.__table__.columns.keys())  # type: ignore[attr-defined] # noqa: B950
+    for resource_type, resource_class in _RESOURCE_CLASSES.items()
+}
 
 
 def get_resource_pk(resource_type):
+    return _RESOURCE_PKS.get(resource_type, "id")
+
+
+@admin.url_value_preprocessor
+def _reject_unknown_resource_type(endpoint, values):
+    # fail unknown resource types before any view work happens
+    if values and "resource_type" in values:
+        if values["resource_type"] not in _RESOURCE_CLASSES:
+            abort(404)
+
+
+@functools.lru_cache(maxsize=None)
+def get_list_display_plan(resource_type):
+    """
+    Build the query plan derived from a resource's `list_display`.
+
+    Relationship metadata is static, so the searchable columns and the
+    related models that need joining are resolved once per resource type
+    instead of on every request. Relations are deduplicated so each one
+    contributes exactly one join.
+
+    Args:
+        resource_type (str): The type of resource to plan for.
+
+    Returns:
+        dict: A dict with the searchable `columns` as
+        (column, needs_cast) pairs and the related attribute names
+        mapped to their model classes in `relations`.
+    """
+
     resource_class = get_resource_class(resource_type)
-    resource_obj = resource_class()
-    if hasattr(resource_obj, "pk"):
-        return resource_obj.pk
-    return "id"
+    model = resource_class.model
+
+    search_columns = []
+    relations = {}
+    scalar_attrs = []
+    relation_columns = {}
+    for column_name in resource_class.list_display:
+        if "." in column_name:
+            related_attribute, related_column = column_name.split(".", 1)
+            related_model = getattr(
+                model, related_attribute
+            ).property.mapper.class_
+            relations.setdefault(related_attribute, related_model)
+            column = getattr(related_model, related_column)
+            relation_columns.setdefault(related_attribute, []).append(column)
+        else:
+            column = model.__table__.columns.get(column_name)
+            if column is None:
+                continue
+            scalar_attrs.append(getattr(model, column_name))
+        # Casting an already-textual column to Text suppresses index use
+        # (including trigram indexes), so only cast non-text columns.
+        # JSON columns must keep the cast: Postgres has no ILIKE
+        # operator for json/jsonb.
+        needs_cast = not isinstance(column.type, (String, Text))
+        search_columns.append((column, needs_cast))
+
+    return {
+        "columns": search_columns,
+        "relations": relations,
+        "scalar_attrs": scalar_attrs,
+        "relation_columns": relation_columns,
+    }
 
 
 def render_template(*args, **kwargs):
@@ -280,7 +534,9 @@ def render_template(*args, **kwargs):
 
     This function is an extension of Flask's `render_template` function.
     It provides additional attributes to the template context,
-    including a list of resource types and their associated permissions.
+    including the permissions associated with each resource type.
+    (The resource-type list itself is injected by the blueprint's
+    context processor.)
 
     Args:
         *args: Variable positional arguments for the
@@ -292,24 +548,17 @@ def render_template(*args, **kwargs):
         str: The rendered template with extended context attributes.
     """
 
-    class_names = get_class_names("admin_view.py")
-    class_names.remove("FlaskAdmin")
-    resource_types = [globals()[x].name for x in class_names]
-    template_attributes = {"resource_types": resource_types}
-    template_attributes["permissions"] = {}
-    for resource_type in resource_types:
-        resource_class = get_resource_class(resource_type)
-        resource_obj = resource_class()
-        resource_permissions = {  # default permissions
-            "create": False,
-            "read": True,
-            "update": False,
-            "delete": False,
-            "export": False,
-            "import": False,
-        }
-        if hasattr(resource_obj, "permissions"):
-            resource_permissions = resource_obj.permissions
+    template_attributes = {"permissions": {}}
+    for resource_type, resource_class in _RESOURCE_CLASSES.items():
+        # classes that declare permissions at class level don't need an
+        # instance; instance-level permissions (typically derived from
+        # current_user in __init__) are still resolved per request
+        resource_permissions = resource_class.__dict__.get("permissions")
+        if resource_permissions is None:
+            resource_obj = resource_class()
+            resource_permissions = getattr(
+                resource_obj, "permissions", _DEFAULT_PERMISSIONS
+            )
         template_attributes["permissions"][
             resource_type
         ] = resource_permissions
@@ -318,89 +567,26 @@ def render_template(*args, **kwargs):
         original_pk = get_resource_pk(kwargs["resource_type"])
 
         if "pagination" in kwargs:
-            for index, item in enumerate(kwargs["pagination"].items):
-                setattr(
-                    kwargs["pagination"].items[index],
-                    "pk",
-                    getattr(item, original_pk),
-                )
+            for item in kwargs["pagination"].items:
+                item.pk = getattr(item, original_pk)
 
         if "resource" in kwargs:
-            setattr(
-                kwargs["resource"],
-                "pk",
-                getattr(kwargs["resource"], original_pk),
-            )
+            resource = kwargs["resource"]
+            resource.pk = getattr(resource, original_pk)
 
     return real_render_template(*args, **kwargs, **template_attributes)
 
 
 def get_readable_attributes(resource_type):
-    resource_class = get_resource_class(resource_type)
-    model = resource_class.model
-
-    ignore_columns = model.__table__.primary_key.columns.keys()
-
-    model_attributes = []
-    for column in model.__table__.columns:
-        model_attributes.append(
-            {"name": str(column.name), "type": str(column.type)}
-        )
-
-    readable_attributes = []
-    for attribute in model_attributes:
-        if attribute["name"] not in ignore_columns:
-            readable_attributes.append(attribute)
-
-    return readable_attributes
+    return _READABLE_ATTRS.get(resource_type, [])
 
 
 def get_editable_attributes(resource_type):
-    resource_class = get_resource_class(resource_type)
-    model = resource_class.model
-
-    primary_key_columns = model.__table__.primary_key.columns.keys()
-    ignore_columns = ["created_at", "updated_at"] + primary_key_columns
-    if hasattr(resource_class, "protected_attributes"):
-        ignore_columns = resource_class.protected_attributes + ignore_columns
-
-    model_attributes = []
-    for column in model.__table__.columns:
-        model_attributes.append(
-            {"name": str(column.name), "type": str(column.type)}
-        )
-
-    editable_attributes = []
-    for attribute in model_attributes:
-        if attribute["name"] not in ignore_columns:
-            editable_attributes.append(attribute)
-
-    return editable_attributes
+    return _EDITABLE_ATTRS.get(resource_type, [])
 
 
 def validate_resource_attribute(resource_type, attribute, initial_value):
-    attribute_value = None
-    if (
-        "VARCHAR" in attribute["type"]
-        or attribute["type"] == "TEXT"
-        or attribute["type"] == "JSON"
-    ):
-        attribute_value = initial_value if initial_value else None
-    elif "INT" in attribute["type"] or attribute["type"] == "FLOAT":
-        attribute_value = initial_value if initial_value else None
-    elif attribute["type"] == "DATE" or attribute["type"] == "DATETIME":
-        attribute_value = initial_value if initial_value else None
-    elif attribute["type"] == "BOOLEAN":
-        if not isinstance(initial_value, bool):
-            attribute_value = None
-            if initial_value.lower() == "true":
-                attribute_value = True
-            elif initial_value.lower() == "false":
-                attribute_value = False
-        else:
-            attribute_value = bool(initial_value)
-
-    return attribute_value
+    return attribute["coerce"](initial_value)
 
 
 class LoginForm(FlaskForm):
@@ -417,11 +603,79 @@ class LoginForm(FlaskForm):
         submit (SubmitField): The field for submitting the login form.
     """
 
-    phone = StringField("Phone", validators=[DataRequired()])
-    password = PasswordField("Password", validators=[DataRequired()])
+    # length bounds reject oversized payloads before any database work
+    phone = StringField("Phone", validators=[DataRequired(), Length(max=64)])
+    password = PasswordField(
+        "Password", validators=[DataRequired(), Length(max=128)]
+    )
     submit = SubmitField("Login")
 
 
+# In-process change counters backing the conditional-GET ETags below.
+# They are only a fallback for models without an updated_at column:
+# nothing bumps them for mutations made by other worker processes or by
+# the host application, so list caching (conditional_get = True) should
+# stay off for such tables outside single-process deployments.
+_TABLE_VERSIONS: dict[str, int] = {}
+
+
+def _bump_table_version(resource_type):
+    _TABLE_VERSIONS[resource_type] = _TABLE_VERSIONS.get(resource_type, 0) + 1
+
+
+def _table_version(resource_type):
+    """
+    Change sentinel for a resource's table.
+
+    When the model tracks updated_at the sentinel is read from the
+    database (latest timestamp plus row count, so deletes are seen
+    too), which stays correct across worker processes and for writes
+    made outside this blueprint. Other models fall back to the
+    in-process counter.
+    """
+    model = get_resource_class(resource_type).model
+    if "updated_at" in model.__table__.columns:
+        latest, total = db.session.query(
+            func.max(model.updated_at), func.count()
+        ).first()
+        return "{}:{}".format(latest, total)
+    return str(_TABLE_VERSIONS.get(resource_type, 0))
+
+
+def _page_etag(resource_type=None):
+    """
+    ETag for the current request derived from the table versions.
+
+    Combines the resource's change sentinel (every resource's sentinel
+    for the dashboard), the query string, and the logged-in user, so a
+    browser revisiting an unchanged page gets a 304 for a few cheap
+    aggregate queries instead of a full page render.
+    """
+    if resource_type is None:
+        version = ":".join(
+            _table_version(resource) for resource in _RESOURCE_TYPES
+        )
+    else:
+        version = _table_version(resource_type)
+    raw = ":".join(
+        [
+            str(resource_type),
+            version,
+            request.query_string.decode("latin-1"),
+            str(current_user.get_id()),
+        ]
+    )
+    return hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+
+def _conditional(rendered, etag):
+    response = app.make_response(rendered)
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.must_revalidate = True
+    return response
+
+
 @admin.route("/")
 @login_required
 def index():
@@ -457,6 +711,13 @@ def dashboard():
     Returns:
         str: The rendered dashboard template.
     """
+    # conditional GET is opt-in here just like conditional_get on the
+    # resource classes, via the host application's admin_configs
+    if admin_configs.get("dashboard-conditional-get"):
+        etag = _page_etag()
+        if etag in request.if_none_match:
+            return Response(status=304)
+        return _conditional(render_template("dashboard.html"), etag)
     return render_template("dashboard.html")
 
 
@@ -492,7 +753,6 @@ def login():
         user = user_model.query.filter(
             getattr(user_model, identifier) == phone
         ).first()
-        bcrypt.init_app(app)
         if user and bcrypt.check_password_hash(user.password, password):
             login_user(user)
             default_route = url_for(".dashboard")
@@ -525,66 +785,58 @@ def logout():
     return redirect(url_for(".login"))
 
 
-def filter_resources(
-    resource_class,
-    model,
-    list_display,
-    search_params,
-    page,
-    per_page,
-    sort=None,
+def build_filter_query(
+    resource_class, model, search_params, sort=None, after=None
 ):
-    primary_key_column = model.__table__.primary_key.columns.keys()[0]
+    primary_key_column = _PRIMARY_KEY_COLUMNS[resource_class.name]
+    plan = get_list_display_plan(resource_class.name)
     filter_query = model.query
     search_query = search_params["search_query"]
     search_query_conditions = []
     if search_query:
-        for column_name in list_display:
-            if "." in column_name:
-                sub_attributes = column_name.split(".")
-                related_attribute = sub_attributes[0]
-                related_model_column = sub_attributes[1]
-                related_model = getattr(
-                    model, related_attribute
-                ).property.mapper.class_
-                search_query_conditions.append(
-                    cast(
-                        getattr(related_model, related_model_column), Text
-                    ).ilike(f"%{search_query}%")
-                )
-            else:
-                column = model.__table__.columns.get(column_name)
-                if column is not None:
-                    search_query_conditions.append(
-                        cast(column, Text).ilike(f"%{search_query}%")
-                    )
+        # build the pattern once, escaping LIKE wildcards so a literal
+        # % or _ in the search text does not match everything
+        escaped_query = (
+            search_query.replace("\\", "\\\\")
+            .replace("%", "\\%")
+            .replace("_", "\\_")
+        )
+        search_pattern = f"%{escaped_query}%"
+        for column, needs_cast in plan["columns"]:
+            if needs_cast:
+                column = cast(column, Text)
+            search_query_conditions.append(
+                column.ilike(search_pattern, escape="\\")
+            )
 
     from_date = search_params["from_date"]
     to_date = search_params["to_date"]
     date_conditions = []
     date_field = getattr(resource_class, "searchable_date_field", "created_at")
+    # Compare the column directly against date bounds parsed in Python.
+    # Wrapping the column in func.date() would force the database to
+    # compute DATE(col) per row and defeat any index on the column.
     if from_date:
         date_conditions.append(
-            func.date(getattr(model, date_field))
-            >= func.date(datetime.strptime(from_date, "%Y-%m-%d"))
+            getattr(model, date_field)
+            >= datetime.strptime(from_date, "%Y-%m-%d").date()
         )
     if to_date:
         date_conditions.append(
-            func.date(getattr(model, date_field))
-            <= func.date(datetime.strptime(to_date, "%Y-%m-%d"))
+            getattr(model, date_field)
+            < datetime.strptime(to_date, "%Y-%m-%d").date() + timedelta(days=1)
         )
 
-    filter_query = filter_query.filter(
-        and_(or_(*search_query_conditions), and_(*date_conditions))
-    )
+    filter_conditions = list(date_conditions)
+    if search_query_conditions:
+        filter_conditions.append(or_(*search_query_conditions))
+    if filter_conditions:
+        filter_query = filter_query.filter(and_(*filter_conditions))
 
     if model.__name__ == "UserModel":
-        role_condition = model.roles.in_(
-            ["cs_user", "admin", "user", "superadmin"]
-        )
-        filter_query = filter_query.filter(
-            or_(role_condition, model.roles.isnot(None))
-        )
+        # or_(roles.in_([...]), roles.isnot(None)) reduced to the isnot
+        # branch anyway; keep just the effective predicate
+        filter_query = filter_query.filter(model.roles.isnot(None))
 
     if sort and len(sort):
         sort_conditions = []
@@ -598,15 +850,18 @@ def filter_resources(
                 sort_conditions.append(column.asc())
         filter_query = filter_query.order_by(*sort_conditions)
     else:
+        if after is not None:
+            # keyset (seek) fast path: on the default primary-key
+            # ordering, seek past the cursor instead of paying a linear
+            # OFFSET for deep pages
+            filter_query = filter_query.filter(
+                getattr(model, primary_key_column) > after
+            )
         filter_query = filter_query.order_by(primary_key_column)
 
     # check for joins
     joinedload_statements = []
-    for attribute in list_display:
-        if "." not in attribute:
-            continue
-        sub_attributes = attribute.split(".")
-        related_attribute = sub_attributes[0]
+    for related_attribute in plan["relations"]:
         joinedload_statements.append(
             joinedload(getattr(model, related_attribute))
         )
@@ -615,6 +870,55 @@ def filter_resources(
     if len(joinedload_statements):
         filter_query = filter_query.options(*joinedload_statements)
 
+    return filter_query
+
+
+def filter_resources(
+    resource_class,
+    model,
+    search_params,
+    page,
+    per_page,
+    sort=None,
+    after=None,
+):
+    filter_query = build_filter_query(
+        resource_class=resource_class,
+        model=model,
+        search_params=search_params,
+        sort=sort,
+        after=after,
+    )
+
+    # the list page only renders the list_display columns (plus the
+    # primary key, which load_only always keeps), so don't fetch the
+    # rest of the row
+    plan = get_list_display_plan(resource_class.name)
+    load_options = []
+    if plan["scalar_attrs"]:
+        load_options.append(load_only(*plan["scalar_attrs"]))
+    for related_attribute, related_attrs in plan["relation_columns"].items():
+        load_options.append(
+            joinedload(getattr(model, related_attribute)).load_only(
+                *related_attrs
+            )
+        )
+    # relationships the list template reads without a dotted
+    # list_display entry can be declared on the resource class so each
+    # one loads in a single extra query instead of one per row
+    for related_attribute in getattr(
+        resource_class, "list_display_relationships", ()
+    ):
+        if related_attribute in plan["relation_columns"]:
+            continue
+        load_options.append(selectinload(getattr(model, related_attribute)))
+    # opt-in guard: make any relationship access that was not eager
+    # loaded above raise instead of silently firing one query per row
+    if getattr(resource_class, "strict_relationship_loading", False):
+        load_options.append(raiseload("*"))
+    if load_options:
+        filter_query = filter_query.options(*load_options)
+
     return filter_query.paginate(page=page, per_page=per_page, error_out=False)
 
 
@@ -650,13 +954,31 @@ def resource_list(resource_type):
             resource_type, status
         )
 
+    conditional_get = request.method == "GET" and getattr(
+        resource_class, "conditional_get", False
+    )
+    if conditional_get:
+        etag = _page_etag(resource_type)
+        if etag in request.if_none_match:
+            return Response(status=304)
+
     per_page = 20
     page = request.args.get("page", default=1, type=int)
+    sort = resource_class.sort if hasattr(resource_class, "sort") else None
+    # optional keyset cursor: resume after the given primary-key value
+    # instead of walking an OFFSET over the whole table; type=int makes
+    # malformed or empty cursors fall back to None like page does. The
+    # cursor only applies to the default primary-key ordering, so ignore
+    # it (and keep page paging) when the class declares its own sort.
+    after = request.args.get("after", default=None, type=int)
+    if sort:
+        after = None
+    if after is not None:
+        page = 1
     search_query = request.args.get("search", default="")
     from_date = request.args.get("from_date", default=None)
     to_date = request.args.get("to_date", default=None)
     list_display = resource_class.list_display
-    sort = resource_class.sort if hasattr(resource_class, "sort") else None
     search_params = {
         "search_query": search_query,
         "from_date": from_date,
@@ -665,14 +987,14 @@ def resource_list(resource_type):
     pagination = filter_resources(
         resource_class=resource_class,
         model=model,
-        list_display=list_display,
         search_params=search_params,
         page=page,
         per_page=per_page,
         sort=sort,
+        after=after,
     )
 
-    return render_template(
+    rendered = render_template(
         "resource/list.html",
         pagination=pagination,
         resource_type=resource_type,
@@ -681,6 +1003,9 @@ def resource_list(resource_type):
         hide_search=hide_search,
         hide_date_filter=hide_date_filter,
     )
+    if conditional_get:
+        return _conditional(rendered, etag)
+    return rendered
 
 
 @admin.route(
@@ -736,6 +1061,7 @@ def resource_create(resource_type):
     new_resource = model(**attributes_to_save)
     db.session.add(new_resource)
     db.session.commit()
+    _bump_table_version(resource_type)
 
     # call after create hook
     if hasattr(resource_class, "after_create_callback"):
@@ -766,7 +1092,7 @@ def resource_read(resource_type, resource_id):
     """
     resource_class = get_resource_class(resource_type)
     model = resource_class.model
-    resource = model.query.get(resource_id)
+    resource = db.session.get(model, resource_id)
 
     if not resource:
         return redirect(
@@ -785,6 +1111,89 @@ def resource_read(resource_type, resource_id):
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _revision_columns(model):
+    """Mapped column keys that get cloned into a revision row."""
+    skip = {"created_at", "updated_at", "promised_token", "token_amount"}
+    return tuple(
+        attribute.key
+        for attribute in inspect(model).mapper.column_attrs
+        if attribute.key not in skip
+    )
+
+
+_DUPLICATE_REASON_ID = None
+
+
+def _duplicate_reason_id():
+    """
+    Id of the constant "duplicate receipt" rejection reason.
+
+    The reason row never changes at runtime, so look it up once and keep
+    the id in-process instead of re-querying on every receipt edit. A
+    missing row is retried on the next call rather than cached.
+    """
+    global _DUPLICATE_REASON_ID
+    if _DUPLICATE_REASON_ID is None:
+        _DUPLICATE_REASON_ID = (
+            db.session.query(ReceiptRejectionReason.id)
+            .filter(
+                ReceiptRejectionReason.short_description
+                == "डुप्लीकेट रसीद एंट्री"
+            )
+            .scalar()
+        )
+    return _DUPLICATE_REASON_ID
+
+
+def _flag_duplicate_receipt(resource):
+    """
+    Reject an edited receipt when an approved duplicate already exists.
+
+    Marks the receipt as unapproved with the duplicate rejection reason
+    if another approved receipt matches its booklet, receipt id, mandi,
+    crop and day.
+    """
+    # receipt_date may still hold the raw form string before the flush,
+    # or be NULL; skip the probe when there is no usable day to compare
+    receipt_day = resource.receipt_date
+    if receipt_day is None:
+        return
+    if isinstance(receipt_day, str):
+        try:
+            receipt_day = datetime.fromisoformat(receipt_day)
+        except ValueError:
+            return
+    if isinstance(receipt_day, datetime):
+        receipt_day = receipt_day.date()
+    # existence probe only: select just the id and compare the date
+    # column against a half-open range so an index on receipt_date
+    # stays usable
+    existing_sale_receipt_id = (
+        db.session.query(SaleReceiptModel.id)
+        .filter(
+            SaleReceiptModel.booklet_number == resource.booklet_number,
+            SaleReceiptModel.receipt_id == resource.receipt_id,
+            SaleReceiptModel.mandi_id == resource.mandi_id,
+            SaleReceiptModel.crop_id == resource.crop_id,
+            SaleReceiptModel.is_approved == True,  # noqa: E712
+            SaleReceiptModel.id != resource.id,
+            SaleReceiptModel.receipt_date >= receipt_day,
+            SaleReceiptModel.receipt_date < receipt_day + timedelta(days=1),
+        )
+        .limit(1)
+        .scalar()
+    )
+    if existing_sale_receipt_id is not None:
+        duplicate_reason_id = _duplicate_reason_id()
+        if duplicate_reason_id is not None:
+            if not resource.rejection_reason_ids:
+                resource.rejection_reason_ids = []
+            resource.rejection_reason_ids.append(duplicate_reason_id)
+        resource.is_approved = False
+        resource.token_amount = 0
+
+
 @admin.route(
     "/resource/<string:resource_type>/<string:resource_id>/edit",
     methods=["GET", "POST"],
@@ -816,7 +1225,13 @@ def resource_edit(resource_type, resource_id):
     """
     resource_class = get_resource_class(resource_type)
     model = resource_class.model
-    resource = model.query.get(resource_id)
+    resource = db.session.get(model, resource_id)
+
+    if not resource:
+        return redirect(
+            request.referrer
+            or url_for(".resource_list", resource_type=resource_type)
+        )
 
     if resource_type == "mandi-receipt":
         selected_reasons = request.form.getlist(
@@ -825,16 +1240,16 @@ def resource_edit(resource_type, resource_id):
 
         resource.rejection_reason_ids = selected_reasons
 
-    if not resource:
-        return redirect(
-            request.referrer
-            or url_for(".resource_list", resource_type=resource_type)
-        )
-
     editable_attributes = get_editable_attributes(resource_type)
-    old_resource = copy.copy(
-        resource
-    )  # make a clone before there are any updates
+    # snapshot the mapped column values before there are any updates;
+    # copy.copy on a mapped instance would duplicate ORM instrumentation
+    # state as well
+    old_resource = SimpleNamespace(
+        **{
+            column: getattr(resource, column)
+            for column in model.__table__.columns.keys()
+        }
+    )
 
     if request.method == "GET":
         return render_template(
@@ -853,26 +1268,22 @@ def resource_edit(resource_type, resource_id):
         revision_model = resource_class.revision_model
         revision_pk = resource_class.revision_pk
 
+        # read loaded values straight from __dict__ so cloning never
+        # triggers lazy loads of unloaded attributes
+        resource_state = resource.__dict__
         cloned_attributes_to_save = {}
-        for column, value in resource.__dict__.items():
-            if column in [
-                "_sa_instance_state",
-                "created_at",
-                "updated_at",
-                "promised_token",
-                "token_amount",
-            ]:
+        for column in _revision_columns(model):
+            if column not in resource_state:
                 continue
-
             if column == "id":
-                cloned_attributes_to_save[revision_pk] = value
+                cloned_attributes_to_save[revision_pk] = resource_state[column]
                 continue
-
-            cloned_attributes_to_save[column] = value
+            cloned_attributes_to_save[column] = resource_state[column]
 
         cloned_resource = revision_model(**cloned_attributes_to_save)
+        # committed together with the resource update below so the edit
+        # and its revision share one transaction
         db.session.add(cloned_resource)
-        db.session.commit()
 
     for attribute in editable_attributes:
         if attribute["name"] in request.form:
@@ -888,36 +1299,25 @@ def resource_edit(resource_type, resource_id):
             setattr(resource, attribute["name"], validated_attribute_value)
 
     if resource_type == "mandi-receipt":
-        updated_mandi = MandiModel.query.get(resource.mandi_id)
-        updated_crop = CropModel.query.get(resource.crop_id)
+        # fetch both lookups in a single round trip
+        updated_mandi, updated_crop = (
+            db.session.query(MandiModel, CropModel)
+            .filter(
+                MandiModel.id == resource.mandi_id,
+                CropModel.id == resource.crop_id,
+            )
+            .first()
+        )
         setattr(resource, "mandi_name", updated_mandi.mandi_name)
         setattr(resource, "mandi_name_hi", updated_mandi.mandi_name_hi)
         setattr(resource, "crop_name", updated_crop.crop_name)
         setattr(resource, "crop_name_hi", updated_crop.crop_name_hi)
 
     if resource_type == "mandi-receipt":
-        existing_sale_receipt = SaleReceiptModel.query.filter(
-            SaleReceiptModel.booklet_number == resource.booklet_number,
-            SaleReceiptModel.receipt_id == resource.receipt_id,
-            SaleReceiptModel.mandi_id == resource.mandi_id,
-            SaleReceiptModel.crop_id == resource.crop_id,
-            SaleReceiptModel.is_approved == True,
-            func.date(SaleReceiptModel.receipt_date)
-            == func.date(resource.receipt_date),
-        ).first()
-        if existing_sale_receipt and existing_sale_receipt.id != resource.id:
-            duplicate_reason = ReceiptRejectionReason.query.filter(
-                ReceiptRejectionReason.short_description
-                == "डुप्लीकेट रसीद एंट्री"
-            ).first()
-            if duplicate_reason is not None:
-                if not resource.rejection_reason_ids:
-                    resource.rejection_reason_ids = []
-                resource.rejection_reason_ids.append(duplicate_reason.id)
-            resource.is_approved = False
-            resource.token_amount = 0
+        _flag_duplicate_receipt(resource)
 
     db.session.commit()
+    _bump_table_version(resource_type)
 
     # call after update hook
     if hasattr(resource_class, "after_update_callback"):
@@ -953,12 +1353,13 @@ def resource_delete(resource_type, resource_id):
     """
     resource_class = get_resource_class(resource_type)
     model = resource_class.model
-    resource = model.query.get(resource_id)
+    resource = db.session.get(model, resource_id)
 
     cloned_resource = resource
     if resource:
         db.session.delete(resource)
         db.session.commit()
+        _bump_table_version(resource_type)
 
     # call after update hook
     if cloned_resource and hasattr(resource_class, "after_delete_callback"):
@@ -992,39 +1393,58 @@ def resource_download(resource_type):
 
     resource_class = get_resource_class(resource_type)
     model = resource_class.model
-    output = io.StringIO()
-    writer = csv.writer(output)
 
-    downloadable_attributes = model.__table__.columns.keys()
+    downloadable_attributes = _DOWNLOADABLE_ATTRS[resource_type]
     search_query = request.args.get("search", default="")
     from_date = request.args.get("from_date", default=None)
     to_date = request.args.get("to_date", default=None)
-    list_display = resource_class.list_display
     search_params = {
         "search_query": search_query,
         "from_date": from_date,
         "to_date": to_date,
     }
-    pagination = filter_resources(
+    filter_query = build_filter_query(
         resource_class=resource_class,
         model=model,
-        list_display=list_display,
         search_params=search_params,
-        page=1,
-        per_page=None,
         sort=None,
     )
-    resources = pagination.items
-
-    writer.writerow(downloadable_attributes)  # csv header
-    for resource in resources:
-        line = []
-        for attribute in downloadable_attributes:
-            line.append(getattr(resource, attribute))
-        writer.writerow(line)
-    output.seek(0)
+
+    def generate():
+        # rows stream out of the database 1000 at a time instead of the
+        # whole result set (and the whole CSV) being held in memory;
+        # selecting the columns directly skips ORM instance hydration
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(downloadable_attributes)  # csv header
+        # yielding bytes lets the response pass each chunk straight to
+        # the WSGI server instead of re-encoding str chunks on the way
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate(0)
+        rows = iter(
+            filter_query.enable_eagerloads(False)
+            .with_entities(
+                *[
+                    model.__table__.c[attribute]
+                    for attribute in downloadable_attributes
+                ]
+            )
+            .yield_per(1000)
+        )
+        while True:
+            batch = list(itertools.islice(rows, 1000))
+            if not batch:
+                break
+            # writerows dispatches the whole batch into the csv module
+            # in one call, and each yield ships one sizeable chunk
+            writer.writerows(batch)
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate(0)
+
     return Response(
-        output,
+        stream_with_context(generate()),
         mimetype="text/csv",
         headers={
             "Content-Disposition": "attachment;filename="
@@ -1059,6 +1479,23 @@ def resource_download_sample(resource_type):
         file template as an attachment with the appropriate headers for
         downloading.
     """
+    body, disposition = _sample_csv(resource_type)
+    return Response(
+        body,
+        mimetype="text/csv",
+        headers={"Content-Disposition": disposition},
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _sample_csv(resource_type):
+    """
+    Prebuilt sample-CSV body and Content-Disposition for a resource type.
+
+    The sample is just the uploadable header row plus a blank row, which
+    is fully determined by the model, so the whole response body (and the
+    disposition string, which runs inflect) is built once per process.
+    """
     output = io.StringIO()
     writer = csv.writer(output)
     uploadable_attributes = get_editable_attributes(resource_type)
@@ -1066,16 +1503,12 @@ def resource_download_sample(resource_type):
     writer.writerow(col_names)  # csv header
     writer.writerow([])  # print a blank second row
 
-    output.seek(0)
-    return Response(
-        output,
-        mimetype="text/csv",
-        headers={
-            "Content-Disposition": "attachment;filename="
-            + admin_label_plural(resource_type)
-            + "-sample.csv"
-        },
+    disposition = (
+        "attachment;filename="
+        + admin_label_plural(resource_type)
+        + "-sample.csv"
     )
+    return output.getvalue().encode("utf-8"), disposition
 
 
 @admin.route(
@@ -1103,46 +1536,113 @@ def resource_upload(resource_type):
 
     if request.method == "POST":
         uploaded_file = request.files["file"]
-        col_names = [attribute["name"] for attribute in uploadable_attributes]
-        csv_data = pd.read_csv(uploaded_file, usecols=col_names)
-        for index, row in csv_data.iterrows():
-            attributes_to_save = {}
-            for attribute in uploadable_attributes:
-                attribute_value = row[attribute["name"]]
-                if pd.isna(attribute_value):
-                    attribute_value = None
-                if (attribute["type"]) in ["VARCHAR", "TEXT", "JSON"]:
-                    attribute_value = attribute_value or None
-                elif attribute["type"] == "INTEGER":
-                    attribute_value = attribute_value or None
-                elif (
-                    attribute["type"] == "DATE"
-                    or attribute["type"] == "DATETIME"
-                ):
-                    attribute_value = attribute_value or None
-                elif attribute["type"] == "BOOLEAN":
-                    if not isinstance(attribute_value, bool):
-                        attribute_value = (
-                            True
-                            if attribute_value.lower() == "true"
-                            else False
-                        )
-                    else:
-                        attribute_value = bool(attribute_value)
-                attributes_to_save[attribute["name"]] = attribute_value
-            new_resource = model(**attributes_to_save)
-            db.session.add(new_resource)
-            db.session.commit()
-
         if uploaded_file:
             uploaded_file.filename = secure_filename(uploaded_file.filename)
-            upload_file_to_s3(uploaded_file)
+            # the async helper works on its own buffered copy, so kick
+            # the S3 transfer off first and let it overlap the database
+            # import below
+            upload_file_to_s3_async(uploaded_file)
+            uploaded_file.stream.seek(0)
+        # stream the CSV row by row instead of loading the whole file,
+        # and insert in bounded batches instead of a commit per row
+        # utf-8-sig strips the BOM that spreadsheet exports often prepend
+        reader_file = io.TextIOWrapper(
+            uploaded_file.stream, encoding="utf-8-sig"
+        )
+        reader = csv.DictReader(reader_file)
+        # reject files whose header doesn't cover the uploadable
+        # columns up front; DictReader would otherwise silently import
+        # NULLs for every missing or misnamed column
+        present_columns = set(reader.fieldnames or [])
+        missing_columns = [
+            attribute["name"]
+            for attribute in uploadable_attributes
+            if attribute["name"] not in present_columns
+        ]
+        if missing_columns:
+            reader_file.detach()
+            flash(
+                "Upload failed, columns missing from the CSV: "
+                + ", ".join(missing_columns)
+            )
+            return redirect(request.url)
+        # chunk size bounds both memory and per-transaction lock time;
+        # resource classes can tune it for unusually wide/narrow rows
+        chunk_size = getattr(resource_class, "upload_chunk_size", 1000)
+
+        def coerced_rows():
+            for row in reader:
+                yield {
+                    attribute["name"]: attribute["coerce"](
+                        row.get(attribute["name"]) or ""
+                    )
+                    for attribute in uploadable_attributes
+                }
+
+        if (
+            getattr(resource_class, "upload_via_copy", False)
+            and db.session.get_bind().dialect.name == "postgresql"
+        ):
+            # opt-in fast path: ship the coerced rows through COPY,
+            # which skips the per-row INSERT parse/plan entirely
+            _upload_via_copy(model, uploadable_attributes, coerced_rows())
+        else:
+            batch = []
+            for attributes_to_save in coerced_rows():
+                batch.append(attributes_to_save)
+                if len(batch) >= chunk_size:
+                    db.session.bulk_insert_mappings(model, batch)
+                    db.session.commit()
+                    batch = []
+            if batch:
+                db.session.bulk_insert_mappings(model, batch)
+                db.session.commit()
+        _bump_table_version(resource_type)
+        # don't let the wrapper close the request's underlying stream
+        reader_file.detach()
 
         flash("All " + resource_type.capitalize() + " uploaded!")
         return redirect(url_for(".resource_list", resource_type=resource_type))
     return render_template("resource/upload.html", resource_type=resource_type)
 
 
+def _upload_via_copy(model, uploadable_attributes, rows):
+    """
+    Bulk-load coerced upload rows with PostgreSQL's COPY FROM STDIN.
+
+    COPY avoids the per-row INSERT parse/plan path and is dramatically
+    faster than executemany-style inserts for large files. Rows are fed
+    to the server in CSV form through a bounded in-memory buffer, so
+    the uploaded file is never materialised in full. Only used when a
+    resource class sets ``upload_via_copy`` and the bind is Postgres;
+    note that COPY's CSV mode reads unquoted empty fields as NULL.
+    """
+    col_names = [attribute["name"] for attribute in uploadable_attributes]
+    statement = "COPY {} ({}) FROM STDIN WITH CSV".format(
+        model.__tablename__, ", ".join(col_names)
+    )
+    cursor = db.session.connection().connection.cursor()
+    try:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        pending = 0
+        for row in rows:
+            writer.writerow([row[name] for name in col_names])
+            pending += 1
+            if pending >= 1000:
+                buffer.seek(0)
+                cursor.copy_expert(statement, buffer)
+                buffer.seek(0)
+                buffer.truncate(0)
+                pending = 0
+        if pending:
+            buffer.seek(0)
+            cursor.copy_expert(statement, buffer)
+    finally:
+        cursor.close()
+    db.session.commit()
+
+
 def get_hashed_password(password):
     """
     Hashes a password using Bcrypt.
@@ -1162,7 +1662,6 @@ def get_hashed_password(password):
     if password == "" or password is None:
         return password
 
-    bcrypt.init_app(app)
     return bcrypt.generate_password_hash(password, 10).decode("utf-8")
 
 
@@ -7,7 +7,6 @@ install_requires = [
     "alembic",
     "inflect",
     "boto3",
-    "pandas",
     "Flask-Login",
     "Flask-WTF",
     "Werkzeug",